@@ -3,7 +3,12 @@ import { query } from "@/lib/db";
 
 export async function GET() {
   try {
-    const posts = await query("SELECT * FROM posts ORDER BY created_at DESC");
+    // List columns explicitly so the large search_vector column stays out of the listing
+    const posts = await query(
+      `SELECT id, wp_id, slug, title, content, excerpt, status, author_id, featured_media, created_at, updated_at
+       FROM posts
+       ORDER BY created_at DESC`
+    );
     return NextResponse.json(posts);
   } catch (error) {
     return NextResponse.json({ error: "Failed to fetch posts" + error }, { status: 500 });
@@ -0,0 +1,27 @@
+import { NextRequest, NextResponse } from "next/server";
+import { query } from "@/lib/db";
+
+// Must match SEARCH_LANGUAGE in db/transform_wordpress_data.py, which builds posts.search_vector
+const SEARCH_LANGUAGE = "english";
+
+export async function GET(request: NextRequest) {
+  const q = request.nextUrl.searchParams.get("q")?.trim();
+  if (!q) {
+    return NextResponse.json([]);
+  }
+
+  try {
+    const posts = await query(
+      `SELECT posts.id, posts.wp_id, posts.slug, posts.title, posts.created_at,
+              ts_rank(posts.search_vector, search.query) AS rank
+       FROM posts, websearch_to_tsquery($1::regconfig, $2) AS search(query)
+       WHERE posts.search_vector @@ search.query
+       ORDER BY rank DESC, posts.created_at DESC
+       LIMIT 20`,
+      [SEARCH_LANGUAGE, q]
+    );
+    return NextResponse.json(posts);
+  } catch (error) {
+    return NextResponse.json({ error: "Failed to search posts" + error }, { status: 500 });
+  }
+}
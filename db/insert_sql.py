@@ -61,6 +61,7 @@ def insert_data():
             "categories.sql",
             "tags.sql",
             "seo_data.sql",  # Enable this once posts are verified
+            "search_index.sql",  # Requires posts; refreshes only changed search vectors
             "media.sql",
             "comments.sql",
             "custom_fields.sql",
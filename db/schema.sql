@@ -11,22 +11,30 @@ CREATE TABLE posts (
     status TEXT,
     author_id INT,
     featured_media INT,
+    search_vector TSVECTOR, -- Weighted full-text search document, written by search_index.sql
+    search_source_md5 TEXT, -- Hash of the title, content and SEO description search_vector was built from
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Index the search vector for full-text queries
+CREATE INDEX idx_posts_search_vector ON posts USING GIN (search_vector);
+
 -- Create a trigger function to update `updated_at`
 CREATE OR REPLACE FUNCTION update_timestamp()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.updated_at = NOW();
+    -- Keep an explicitly supplied timestamp (e.g. WordPress `modified` on upsert)
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at = NOW();
+    END IF;
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
 
--- Attach trigger to posts table
+-- Attach trigger to posts table (search_vector refreshes must not bump `updated_at`)
 CREATE TRIGGER trigger_update_timestamp
-BEFORE UPDATE ON posts
+BEFORE UPDATE OF wp_id, slug, title, content, excerpt, status, author_id, featured_media ON posts
 FOR EACH ROW
 EXECUTE FUNCTION update_timestamp();
 
@@ -48,7 +56,10 @@ CREATE TABLE pages (
 CREATE OR REPLACE FUNCTION update_timestamp()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.updated_at = NOW();
+    -- Keep an explicitly supplied timestamp (e.g. WordPress `modified` on upsert)
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at = NOW();
+    END IF;
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
@@ -73,6 +84,25 @@ CREATE TABLE seo_data (
     schema JSONB -- Store structured schema data in JSONB format
 );
 
+-- Clear a post's search vector when its SEO description changes so search_index.sql rebuilds it
+CREATE OR REPLACE FUNCTION clear_post_search_vector()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.meta_description IS DISTINCT FROM OLD.meta_description THEN
+        UPDATE posts
+        SET search_vector = NULL,
+            search_source_md5 = NULL
+        WHERE wp_id = NEW.post_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_clear_post_search_vector
+AFTER INSERT OR UPDATE OF meta_description ON seo_data
+FOR EACH ROW
+EXECUTE FUNCTION clear_post_search_vector();
+
 
 -- Create the categories table
 CREATE TABLE categories (
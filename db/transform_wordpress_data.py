@@ -1,11 +1,17 @@
+import hashlib
 import json
 import os
+from html.parser import HTMLParser
 
 # Load JSON data
 DATA_DIR = "wordpress_data"
 OUTPUT_DIR = "sql_data"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Full-text search settings
+SEARCH_LANGUAGE = "english"  # Must match SEARCH_LANGUAGE in client/src/app/api/search/route.ts
+SEARCH_BATCH_SIZE = 500  # Posts per bulk UPDATE statement
+
 
 def load_json(filename):
     """Load JSON data from a file."""
@@ -23,6 +29,98 @@ def escape(value):
     return "'" + value.replace("'", "''") + "'"
 
 
+def md5_hex(value):
+    """Return the hex MD5 of a string, matching PostgreSQL's md5() on UTF-8 text."""
+    return hashlib.md5((value or "").encode("utf-8")).hexdigest()
+
+
+class HTMLTextExtractor(HTMLParser):
+    """Collect the visible text of an HTML fragment, skipping scripts and styles."""
+
+    SKIP_TAGS = {"script", "style"}
+    # Block-level and line-break tags separate words; every other tag is inline
+    BREAK_TAGS = {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "br",
+        "caption",
+        "dd",
+        "details",
+        "div",
+        "dl",
+        "dt",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "summary",
+        "table",
+        "tbody",
+        "td",
+        "tfoot",
+        "th",
+        "thead",
+        "tr",
+        "ul",
+    }
+
+    def __init__(self):
+        super().__init__()  # convert_charrefs=True decodes entities like &#8217;
+        self.parts = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in self.BREAK_TAGS:
+            self.parts.append(" ")  # Keep words in adjacent blocks apart
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+        elif tag in self.BREAK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+
+def strip_html(value):
+    """Return the plain text of an HTML string with whitespace collapsed.
+
+    >>> strip_html("<p>Hello&#8217;s <b>wor</b>ld</p><script>x()</script><p>Next<br>line</p>")
+    'Hello’s world Next line'
+    >>> strip_html("<h2>Title</h2><style>p {}</style><ul><li>one</li><li>two</li></ul>")
+    'Title one two'
+    >>> strip_html("<p>un<wbr>break <del>ab</del><ins>c</ins></p><td>x</td><td>y</td>")
+    'unbreak abc x y'
+    """
+    if not value:
+        return ""
+    parser = HTMLTextExtractor()
+    parser.feed(value)
+    parser.close()
+    return " ".join("".join(parser.parts).split())
+
+
 def transform_posts(posts):
     """Convert posts JSON to SQL INSERT statements."""
     sql_statements = []
@@ -39,7 +137,19 @@ def transform_posts(posts):
             {post.get('featured_media', 'NULL')}, 
             {escape(post['date'])},
             {escape(post['modified'])}
-        ) ON CONFLICT (wp_id) DO NOTHING;
+        )
+        ON CONFLICT (wp_id) DO UPDATE
+        SET title = EXCLUDED.title,
+            content = EXCLUDED.content,
+            slug = EXCLUDED.slug,
+            status = EXCLUDED.status,
+            author_id = EXCLUDED.author_id,
+            featured_media = EXCLUDED.featured_media,
+            updated_at = EXCLUDED.updated_at,
+            search_vector = NULL,
+            search_source_md5 = NULL
+        WHERE (posts.title, posts.content, posts.slug, posts.status, posts.author_id, posts.featured_media)
+            IS DISTINCT FROM (EXCLUDED.title, EXCLUDED.content, EXCLUDED.slug, EXCLUDED.status, EXCLUDED.author_id, EXCLUDED.featured_media);
         """
         sql_statements.append(sql.strip())
 
@@ -84,6 +194,59 @@ def transform_seo(seo_data, existing_post_ids):
     return sql_statements
 
 
+def transform_search_index(posts, seo_data):
+    """Convert posts and SEO metadata to SQL UPDATE statements for posts.search_vector."""
+    descriptions = {
+        item["post_id"]: item.get("meta_description") or "" for item in seo_data
+    }
+
+    rows = []
+    for post in posts:
+        title = post["title"]["rendered"]
+        content = post["content"]["rendered"]
+        description = descriptions.get(post["id"], "")
+        rows.append(
+            f"({post['id']}, "
+            f"'{md5_hex(chr(0).join([title, content, description]))}', "
+            f"'{md5_hex(title)}', '{md5_hex(content)}', '{md5_hex(description)}', "
+            f"{escape(strip_html(title))}, "
+            f"{escape(strip_html(description))}, "
+            f"{escape(strip_html(content))})"
+        )
+
+    # Weights: title A, SEO meta description B, body C
+    vector = (
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', src.title), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', src.description), 'B') || "
+        f"setweight(to_tsvector('{SEARCH_LANGUAGE}', src.body), 'C')"
+    )
+
+    sql_statements = []
+    for start in range(0, len(rows), SEARCH_BATCH_SIZE):
+        values = ",\n            ".join(rows[start : start + SEARCH_BATCH_SIZE])
+        # Skip posts whose stored source hash is current; hash the stored text
+        # only for the rest, and only index it when it matches this dump
+        sql = f"""
+        UPDATE posts
+        SET search_vector = {vector},
+            search_source_md5 = src.source_md5
+        FROM (VALUES
+            {values}
+        ) AS src (wp_id, source_md5, title_md5, content_md5, description_md5, title, description, body)
+        LEFT JOIN seo_data ON seo_data.post_id = src.wp_id
+        WHERE posts.wp_id = src.wp_id
+          AND CASE
+              WHEN posts.search_source_md5 IS NOT DISTINCT FROM src.source_md5 THEN FALSE
+              ELSE md5(posts.title) = src.title_md5
+                  AND md5(COALESCE(posts.content, '')) = src.content_md5
+                  AND md5(COALESCE(seo_data.meta_description, '')) = src.description_md5
+          END;
+        """
+        sql_statements.append(sql.strip())
+
+    return sql_statements
+
+
 def transform_categories(categories):
     """Convert categories JSON to SQL INSERT statements."""
     sql_statements = []
@@ -249,6 +412,7 @@ def main():
 
     seo_sql = transform_seo(seo_data, existing_post_ids)  # Pass existing_post_ids
     media_sql = transform_media(media, existing_post_ids)  # Pass existing_post_ids
+    search_index_sql = transform_search_index(posts, seo_data)
 
     category_sql = transform_categories(categories)
     tag_sql = transform_tags(tags)
@@ -260,6 +424,7 @@ def main():
     print("Saving SQL files...")
     save_sql(post_sql, "posts.sql")
     save_sql(seo_sql, "seo_data.sql")
+    save_sql(search_index_sql, "search_index.sql")
     save_sql(category_sql, "categories.sql")
     save_sql(tag_sql, "tags.sql")
     save_sql(media_sql, "media.sql")